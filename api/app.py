@@ -1,10 +1,23 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, json
 # Import the new central controller
 from services.main_controller import process_request
+from services.admission_controller import AdmissionRejected
+# Import the background refresher that keeps archive entries fresh
+from services.archive_refresher import start_archive_refresher
+# Import the archive ETag lookup and the pre-encoded response cache
+from services.memory.archive_manager import find_archive_etag, touch_archive_entry
+from services.memory.response_cache import (
+    SUPPORTED_ENCODINGS, encode_body, get_cached_body, cache_body, representation_etag, strip_etag_coding
+)
+# Import the logging subsystem for request-scoped trace IDs
+from services.observability.logger import start_trace
 
 # Initialize the Flask application
 app = Flask(__name__)
 
+# Refresh stale archive entries and pre-warm popular ones in the background
+start_archive_refresher()
+
 # --- Root Endpoint ---
 @app.route('/', methods=['GET'])
 def index():
@@ -13,12 +26,55 @@ def index():
     """
     return jsonify({"status": "success", "message": "Welcome to the Integrated Intelligence Platform API!"})
 
+# --- Response Encoding ---
+def build_response(body, trace_id, etag=None):
+    """
+    Serializes and, for large bodies, compresses a response for the client's Accept-Encoding.
+    Archive-served answers carry an ETag, and their encoded bodies are cached so
+    popular answers are not re-serialized or recompressed on every request.
+    """
+    encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+
+    cached = get_cached_body(etag, encoding) if etag else None
+    if cached:
+        data, applied_encoding = cached
+    else:
+        data, applied_encoding = encode_body(json.dumps(body).encode(), encoding)
+        if etag:
+            cache_body(etag, encoding, data, applied_encoding)
+
+    response = Response(data, mimetype='application/json')
+    if applied_encoding:
+        response.headers['Content-Encoding'] = applied_encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    if etag:
+        response.set_etag(representation_etag(etag, applied_encoding))
+    response.headers['X-Trace-ID'] = trace_id
+    return response
+
+def match_etag(if_none_match, etag):
+    """
+    Returns the client's tag that matches an archive entry's ETag, or None.
+    If-None-Match uses weak comparison, so weak tags (e.g. from a proxy that recompressed
+    the body) match too, and the client may hold any encoding of the answer.
+    """
+    if if_none_match.star_tag:
+        # "*" matches any current representation; answer with the one we would send now.
+        encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+        cached = get_cached_body(etag, encoding)
+        return representation_etag(etag, cached[1] if cached else None)
+    return next((tag for tag in if_none_match.as_set(include_weak=True) if strip_etag_coding(tag) == etag), None)
+
 # --- Main AI Generation Endpoint ---
 @app.route('/api/generate', methods=['POST'])
 async def generate():
     """
     The primary endpoint that connects to our AI Core.
     """
+    # Every log line produced while handling this request carries its trace ID.
+    # Clients may supply their own via the X-Request-ID header.
+    trace_id = start_trace(request.headers.get('X-Request-ID'))
+
     # Get the user's query from the request
     data = request.get_json()
     if not data or 'prompt' not in data:
@@ -32,20 +88,62 @@ async def generate():
     # This could include things like preferred data sources (e.g., 'academic_only', 'allow_tor')
     user_preferences = data.get('preferences', {})
 
+    return await run_generation(prompt, mode, user_preferences, trace_id)
+
+# --- Conditional Lookup Endpoint ---
+@app.route('/api/generate', methods=['GET'])
+async def generate_lookup():
+    """
+    The cacheable GET form of /api/generate, e.g. /api/generate?prompt=...&mode=...
+    If the client's If-None-Match matches the archived answer, replies 304 without sending it again.
+    """
+    trace_id = start_trace(request.headers.get('X-Request-ID'))
+
+    prompt = request.args.get('prompt')
+    if not prompt:
+        return jsonify({"status": "error", "message": "Missing 'prompt' query parameter"}), 400
+    mode = request.args.get('mode', 'powerful')
+
+    if request.if_none_match:
+        etag = find_archive_etag(prompt)
+        matched = etag and match_etag(request.if_none_match, etag)
+        if matched:
+            # Still an archive hit: count it for tiering and pre-warming, and refresh it if stale.
+            touch_archive_entry(prompt)
+            response = Response(status=304)
+            response.set_etag(matched, weak=request.if_none_match.is_weak(matched))
+            response.headers['Vary'] = 'Accept-Encoding'
+            response.headers['X-Trace-ID'] = trace_id
+            return response
+
+    return await run_generation(prompt, mode, {}, trace_id)
+
+async def run_generation(prompt, mode, user_preferences, trace_id):
+    """
+    Runs a prompt through the central controller and builds the client response.
+    """
     # Call the new central controller
-    response_payload, model_used, diagnostic_report = await process_request(
-        prompt=prompt,
-        mode=mode,
-        user_preferences=user_preferences
-    )
+    try:
+        response_payload, model_used, diagnostic_report, etag = await process_request(
+            prompt=prompt,
+            mode=mode,
+            user_preferences=user_preferences
+        )
+    except AdmissionRejected as e:
+        # The server is overloaded for this mode: shed the request early.
+        response = jsonify({"status": "error", "message": f"Server is busy. {e.reason}"})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(e.retry_after)
+        response.headers['X-Trace-ID'] = trace_id
+        return response
 
     # Return the structured response to the client
-    return jsonify({
+    return build_response({
         "status": "success",
         "response": response_payload, # This is now an object with 'text' and 'image_url'
         "model_used": model_used,
         "diagnostic_report": diagnostic_report
-    })
+    }, trace_id, etag)
 
 # --- Main execution block ---
 if __name__ == '__main__':
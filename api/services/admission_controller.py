@@ -0,0 +1,170 @@
+# This file implements admission control for the expensive live-generation path.
+# Archive hits never pass through here; they are answered before a live slot is requested.
+# Live requests get a limited number of concurrent slots per mode and a bounded waiting queue,
+# and are rejected early (HTTP 429) when the queue is full or their wait could not be met.
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+from .observability.logger import get_logger
+
+# --- Configuration ---
+# Per-mode limits: concurrent live requests, requests allowed to wait, and the longest wait (seconds).
+# "default" applies to any mode without its own entry.
+ADMISSION_LIMITS = {
+    "powerful": {"max_concurrency": 2, "max_queue": 8, "max_wait": 10.0},
+    "default": {"max_concurrency": 4, "max_queue": 16, "max_wait": 5.0},
+}
+# Overrides, e.g. ADMISSION_LIMITS="powerful=2:8:10,own_system=4:16:5"
+ADMISSION_LIMITS_OVERRIDE = os.environ.get("ADMISSION_LIMITS", "")
+# Weight of the newest sample in the rolling service-time estimate.
+SERVICE_TIME_EWMA_ALPHA = 0.2
+
+logger = get_logger("admission_controller")
+
+for _item in ADMISSION_LIMITS_OVERRIDE.split(","):
+    if "=" in _item:
+        _mode, _values = _item.split("=", 1)
+        _concurrency, _queue, _wait = _values.split(":")
+        ADMISSION_LIMITS[_mode.strip()] = {"max_concurrency": int(_concurrency), "max_queue": int(_queue), "max_wait": float(_wait)}
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a live request is shed. `retry_after` is a hint in whole seconds.
+    """
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+class _Ticket:
+    """
+    A queued request's place in line. `granted` is only changed under the lane's lock.
+    """
+    def __init__(self, loop):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.granted = False
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+class LiveLane:
+    """
+    The concurrency slots and FIFO waiting queue for one mode's live-generation requests.
+    Requests are served on per-request event loops in different threads, so state is guarded by a
+    lock and a freed slot is handed straight to the head of the queue on the waiter's own loop.
+    """
+    def __init__(self, mode: str, max_concurrency: int, max_queue: int, max_wait: float):
+        self.mode = mode
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.active = 0
+        self.service_time = None # Rolling estimate of how long a live request holds its slot
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def _estimated_wait(self, position: int) -> float:
+        """
+        Expected wait for the request at `position` in the queue (1 = next in line).
+        """
+        if self.service_time is None:
+            return 0.0
+        return math.ceil(position / self.max_concurrency) * self.service_time
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self._estimated_wait(len(self._waiters) + 1)))
+
+    async def acquire(self):
+        """
+        Takes a slot, waiting in line if needed. Raises AdmissionRejected instead of waiting
+        when the queue is full or the expected wait exceeds the mode's max_wait.
+        """
+        with self._lock:
+            # Take a free slot straight away unless others are already queued for one.
+            if self.active < self.max_concurrency and not self._waiters:
+                self.active += 1
+                return
+            if len(self._waiters) >= self.max_queue:
+                raise AdmissionRejected(f"Live queue for mode '{self.mode}' is full.", self._retry_after())
+            if self._estimated_wait(len(self._waiters) + 1) > self.max_wait:
+                raise AdmissionRejected(f"Live queue for mode '{self.mode}' cannot meet the deadline.", self._retry_after())
+            ticket = _Ticket(asyncio.get_running_loop())
+            self._waiters.append(ticket)
+
+        try:
+            await asyncio.wait_for(ticket.future, timeout=self.max_wait)
+        except BaseException as e:
+            with self._lock:
+                if ticket.granted:
+                    # The slot was handed over just as we gave up: keep it unless we were cancelled.
+                    if not isinstance(e, asyncio.TimeoutError):
+                        self._hand_off()
+                        raise
+                    return
+                self._waiters.remove(ticket)
+                retry_after = self._retry_after()
+            if isinstance(e, asyncio.TimeoutError):
+                raise AdmissionRejected(f"Timed out waiting for a live slot in mode '{self.mode}'.", retry_after)
+            raise
+
+    def _hand_off(self):
+        """
+        Passes a freed slot to the first waiter whose loop is still running, or frees it.
+        Must be called with the lock held.
+        """
+        while self._waiters:
+            ticket = self._waiters.popleft()
+            try:
+                ticket.loop.call_soon_threadsafe(_wake, ticket.future)
+            except RuntimeError:
+                continue # The waiter's event loop has closed; skip it
+            ticket.granted = True
+            return
+        self.active -= 1
+
+    def release(self, service_time: float):
+        with self._lock:
+            if self.service_time is None:
+                self.service_time = service_time
+            else:
+                self.service_time = (1 - SERVICE_TIME_EWMA_ALPHA) * self.service_time + SERVICE_TIME_EWMA_ALPHA * service_time
+            self._hand_off()
+
+_lanes = {}
+_lanes_lock = threading.Lock()
+
+def get_lane(mode: str) -> LiveLane:
+    """
+    Returns the live lane for a mode, creating it from ADMISSION_LIMITS on first use.
+    """
+    # Unknown modes share the default lane so clients cannot create lanes at will.
+    key = mode if mode in ADMISSION_LIMITS else "default"
+    with _lanes_lock:
+        if key not in _lanes:
+            _lanes[key] = LiveLane(key, **ADMISSION_LIMITS[key])
+        return _lanes[key]
+
+@asynccontextmanager
+async def live_slot(mode: str):
+    """
+    Holds a live-generation slot for the duration of the block.
+    """
+    lane = get_lane(mode)
+    try:
+        await lane.acquire()
+    except AdmissionRejected as e:
+        logger.warning("Shedding live request: %s Retry after %ss.", e.reason, e.retry_after)
+        raise
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        lane.release(time.monotonic() - started)
@@ -3,6 +3,10 @@ import os
 from duckduckgo_search import DDGS
 import wikipedia
 
+from .observability.logger import get_logger
+
+logger = get_logger("agents")
+
 # Using mocked tools to bypass environmental network restrictions and test agent logic.
 class Toolbelt:
     """
@@ -14,7 +18,7 @@ class Toolbelt:
 
     def search_web(self, query: str, max_results: int = 5):
         """Returns a mocked web search result."""
-        print(f"MOCKED TOOL: Simulating web search for '{query}'...")
+        logger.debug("MOCKED TOOL: Simulating web search for '%s'...", query)
         if "openai" in query.lower():
             return [
                 {"title": "OpenAI - Wikipedia", "body": "OpenAI is an American artificial intelligence (AI) research laboratory consisting of the non-profit OpenAI, Inc. ... Its founders are Sam Altman, Elon Musk, Greg Brockman, Ilya Sutskever, Wojciech Zaremba, and John Schulman."},
@@ -24,7 +28,7 @@ class Toolbelt:
 
     def search_wikipedia(self, query: str, sentences: int = 3):
         """Returns a mocked Wikipedia summary."""
-        print(f"MOCKED TOOL: Simulating Wikipedia search for '{query}'...")
+        logger.debug("MOCKED TOOL: Simulating Wikipedia search for '%s'...", query)
         if "openai" in query.lower():
             return "OpenAI is an artificial intelligence research organization. It was founded in December 2015 by Sam Altman, Greg Brockman, Elon Musk, Ilya Sutskever, Wojciech Zaremba, and John Schulman. Their mission is to ensure that artificial general intelligence benefits all of humanity."
         return f"This is a mocked Wikipedia summary for the query: '{query}'."
@@ -53,7 +57,7 @@ class FactFinderAgent(Agent):
         )
 
     def run(self, task: str) -> str:
-        print(f"AGENT '{self.name}': Starting task - {task}")
+        logger.debug("AGENT '%s': Starting task - %s", self.name, task)
 
         # --- Step 1: Search the web ---
         web_results = self.toolbelt.search_web(task)
@@ -77,7 +81,7 @@ class FactFinderAgent(Agent):
         else:
             report += "No web results found.\n"
 
-        print(f"AGENT '{self.name}': Task completed.")
+        logger.info("AGENT '%s': Task completed.", self.name)
         return report
 
 # Import the powerful model's generation function directly to prevent circular imports
@@ -92,7 +96,7 @@ def run_agent_swarm(prompt: str):
     fact_finder = FactFinderAgent()
     raw_report = fact_finder.run(prompt)
 
-    print("AGENT SWARM: Raw report gathered. Now synthesizing with powerful model...")
+    logger.info("AGENT SWARM: Raw report gathered. Now synthesizing with powerful model...")
 
     # Step 2: Create a new prompt for the powerful AI to summarize the raw report
     synthesis_prompt = (
@@ -3,6 +3,10 @@
 
 # For now, we will simulate the behavior of a powerful AI model for these tasks.
 
+from ..observability.logger import get_logger
+
+logger = get_logger("research_suite")
+
 # --- 1. Hypothesis Expansion Core ---
 def expand_question(prompt: str):
     """
@@ -11,7 +15,7 @@ def expand_question(prompt: str):
 
     This simulates the "Question Analyst" AI agent.
     """
-    print(f"Question Analyst: Expanding prompt '{prompt[:30]}...'")
+    logger.debug("Question Analyst: Expanding prompt '%s...'", prompt[:30])
 
     # In a real implementation, this would be a call to a powerful LLM.
     # We simulate that by creating a predefined set of analytical questions.
@@ -24,7 +28,7 @@ def expand_question(prompt: str):
         f"What are the primary criticisms or challenges related to '{prompt}'?"
     ]
 
-    print(f"Question Analyst: Generated {len(sub_questions)} sub-questions.")
+    logger.debug("Question Analyst: Generated %d sub-questions.", len(sub_questions))
     return sub_questions
 
 # --- 2. Cross-Verification Fact-Checker (Placeholder) ---
@@ -33,11 +37,11 @@ def fact_check_data(consolidated_data: str):
     Analyzes data from multiple sources to identify consensus and contradictions.
     This simulates the "Fact-Checker" AI agent.
     """
-    print("Fact-Checker: Cross-verifying data from multiple sources...")
+    logger.debug("Fact-Checker: Cross-verifying data from multiple sources...")
     # Placeholder logic: Assumes the data is valid for now.
     # In a real system, this would involve complex NLP to find agreements.
     verified_summary = f"[Verified Fact] {consolidated_data}"
-    print("Fact-Checker: Verification complete.")
+    logger.info("Fact-Checker: Verification complete.")
     return verified_summary
 
 # --- 3. Academic Integrity Suite (Placeholders) ---
@@ -45,7 +49,7 @@ def check_plagiarism(user_text: str, internet_text: str):
     """
     Compares user text with internet data to check for plagiarism.
     """
-    print("Academic Integrity: Checking for plagiarism...")
+    logger.info("Academic Integrity: Checking for plagiarism...")
     # Placeholder: Returns a simulated similarity score.
     similarity_score = 0.15 # Simulate a low score
     return similarity_score
@@ -54,6 +58,6 @@ def paraphrase_text(text_to_rewrite: str):
     """
     Rewrites a piece of text in a new, original way.
     """
-    print("Academic Integrity: Paraphrasing text...")
+    logger.info("Academic Integrity: Paraphrasing text...")
     # Placeholder: Simulates rewriting.
     return f"[Paraphrased] {text_to_rewrite}"
@@ -0,0 +1,142 @@
+# This file keeps the Eternal Archive fresh in the background.
+# Stale entries served by find_in_archive are refreshed through the normal live pipeline
+# ("stale-while-revalidate"), and the pre-warmer refreshes the hottest entries before they expire.
+# All refreshes run on one background event loop under a shared concurrency budget.
+
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+
+from .main_controller import run_live_pipeline, SECURITY_BLOCK_MODEL, NO_SOURCE_MODEL
+from .memory.archive_manager import snapshot_archive, set_refresh_handler, is_entry_stale
+from .observability.logger import get_logger, start_trace
+
+# --- Configuration ---
+# How many refreshes may run at once, and how many may wait, in the background.
+REFRESH_CONCURRENCY = int(os.environ.get("ARCHIVE_REFRESH_CONCURRENCY", "2"))
+REFRESH_MAX_PENDING = int(os.environ.get("ARCHIVE_REFRESH_MAX_PENDING", "100"))
+# After a failed refresh, the prompt is not retried for this long (the stale answer keeps being served).
+REFRESH_RETRY_BACKOFF_SECONDS = float(os.environ.get("ARCHIVE_REFRESH_RETRY_BACKOFF", "300"))
+# Refreshes run the live pipeline under this mode.
+REFRESH_MODE = os.environ.get("ARCHIVE_REFRESH_MODE", "powerful")
+# The pre-warmer refreshes the top-N hottest entries that expire within the lead time.
+PREWARM_TOP_N = int(os.environ.get("ARCHIVE_PREWARM_TOP_N", "20"))
+PREWARM_INTERVAL_SECONDS = float(os.environ.get("ARCHIVE_PREWARM_INTERVAL", "300"))
+PREWARM_LEAD_SECONDS = int(os.environ.get("ARCHIVE_PREWARM_LEAD", "3600"))
+# Hotness halves for every this many seconds since an entry was last accessed.
+PREWARM_HALF_LIFE_SECONDS = float(os.environ.get("ARCHIVE_PREWARM_HALF_LIFE", str(24 * 3600)))
+
+logger = get_logger("archive_refresher")
+
+_loop = None
+_semaphore = None
+_in_flight = set()
+_failed_at = {} # prompt -> time.monotonic() of its last failed refresh
+_in_flight_lock = threading.Lock()
+_start_lock = threading.Lock()
+
+# --- Refreshing ---
+
+def schedule_refresh(prompt):
+    """
+    Queues a background refresh for a prompt. Never blocks; duplicates and overflow are dropped.
+    Returns True if a refresh was scheduled.
+    """
+    if _loop is None:
+        return False
+    with _in_flight_lock:
+        if prompt in _in_flight or len(_in_flight) >= REFRESH_MAX_PENDING:
+            return False
+        failed_at = _failed_at.get(prompt)
+        if failed_at is not None and time.monotonic() - failed_at < REFRESH_RETRY_BACKOFF_SECONDS:
+            return False
+        _in_flight.add(prompt)
+    asyncio.run_coroutine_threadsafe(_refresh(prompt), _loop)
+    return True
+
+async def _refresh(prompt):
+    """
+    Re-runs the live pipeline for a prompt, which stores the new answer in the archive.
+    If the pipeline produces no archivable answer, the stale entry stays in place and the
+    prompt is backed off before the next attempt.
+    """
+    start_trace()
+    succeeded = False
+    try:
+        async with _semaphore:
+            logger.info("Refreshing archive entry for '%s...'", prompt[:30])
+            _, model_used, diagnostic_report, _ = await run_live_pipeline(prompt, REFRESH_MODE, {})
+        if model_used in (SECURITY_BLOCK_MODEL, NO_SOURCE_MODEL):
+            logger.warning("Refresh for '%s...' produced no answer (%s). Keeping the stale entry.", prompt[:30], diagnostic_report)
+        else:
+            succeeded = True
+    except Exception as e:
+        logger.error("Refresh for '%s...' failed: %s", prompt[:30], e)
+    finally:
+        with _in_flight_lock:
+            _in_flight.discard(prompt)
+            if succeeded:
+                _failed_at.pop(prompt, None)
+            else:
+                _failed_at[prompt] = time.monotonic()
+
+# --- Pre-warming ---
+
+def hotness(entry, now):
+    """
+    Access count, decayed by how long ago the entry was last used.
+    """
+    last_accessed = datetime.fromisoformat(entry.get("last_accessed", entry["timestamp"]))
+    age_seconds = max(0.0, (now - last_accessed).total_seconds())
+    return entry.get("access_count", 0) * 0.5 ** (age_seconds / PREWARM_HALF_LIFE_SECONDS)
+
+def select_prewarm_candidates(entries):
+    """
+    Prompts of the top-N hottest entries that are stale or about to be.
+    """
+    now = datetime.utcnow()
+    valid_entries = [entry for entry in entries.values() if isinstance(entry, dict) and "prompt" in entry and "timestamp" in entry]
+    hottest = sorted(valid_entries, key=lambda entry: hotness(entry, now), reverse=True)[:PREWARM_TOP_N]
+    return [entry["prompt"] for entry in hottest if is_entry_stale(entry, lead_seconds=PREWARM_LEAD_SECONDS)]
+
+async def _prewarm_loop():
+    while True:
+        try:
+            candidates = select_prewarm_candidates(snapshot_archive())
+            scheduled = sum(schedule_refresh(prompt) for prompt in candidates)
+            if scheduled:
+                logger.info("Pre-warmer scheduled %d refreshes.", scheduled)
+        except Exception as e:
+            logger.error("Pre-warm pass failed: %s", e)
+        await asyncio.sleep(PREWARM_INTERVAL_SECONDS)
+
+# --- Startup ---
+
+def start_archive_refresher():
+    """
+    Starts the background loop, hooks stale-entry refreshes into the archive and starts the pre-warmer.
+    Safe to call more than once.
+    """
+    global _loop
+    with _start_lock:
+        if _loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            global _semaphore
+            asyncio.set_event_loop(loop)
+            _semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+            loop.create_task(_prewarm_loop())
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, name="archive-refresher", daemon=True).start()
+        ready.wait()
+        _loop = loop
+
+    set_refresh_handler(schedule_refresh)
+    logger.info("Archive refresher started.")
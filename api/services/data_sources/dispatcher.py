@@ -3,76 +3,274 @@
 # and will orchestrate the "Parallel Scraping Swarm".
 
 import asyncio # For running scrapers in parallel
+import os
+import threading
+import time
 
 # Import the new research suite agents
 from ..agents.research_suite import expand_question
+from ..observability.logger import get_logger
 
 # Placeholder for future tool/agent imports
 # from .tools.academic_search import search_arxiv, search_google_scholar
 # from .tools.dark_wing import search_tor_network
 
+# --- Configuration ---
+# The sources the swarm can route to. Each entry is the simulated latency of its placeholder scraper.
+DATA_SOURCES = {
+    "web_search": {"delay": 0.7},
+    "wikipedia": {"delay": 0.5},
+    "academic": {"delay": 1.2},
+}
+
+# Weight of the newest sample in the rolling (EWMA) latency and error-rate stats.
+HEALTH_EWMA_ALPHA = float(os.environ.get("SOURCE_HEALTH_EWMA_ALPHA", "0.3"))
+# Circuit breaker: trip after this many consecutive failures, then wait before a half-open probe.
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("SOURCE_BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_COOLDOWN_SECONDS = float(os.environ.get("SOURCE_BREAKER_COOLDOWN", "30"))
+# Adaptive timeouts: a multiple of the observed latency, clamped to [min, max].
+SOURCE_TIMEOUT_MULTIPLIER = float(os.environ.get("SOURCE_TIMEOUT_MULTIPLIER", "3.0"))
+SOURCE_TIMEOUT_MIN_SECONDS = float(os.environ.get("SOURCE_TIMEOUT_MIN", "1.0"))
+SOURCE_TIMEOUT_MAX_SECONDS = float(os.environ.get("SOURCE_TIMEOUT_MAX", "10.0"))
+# Routing cost is latency inflated by the error rate; this caps the inflation for very unreliable sources.
+MIN_SUCCESS_RATE = 0.05
+# Latency assumed for a source that has been called but has no latency sample yet.
+SOURCE_DEFAULT_LATENCY_SECONDS = float(os.environ.get("SOURCE_DEFAULT_LATENCY", "1.0"))
+
+logger = get_logger("dispatcher")
+
+# --- Source Health Tracking ---
+
+class SourceHealth:
+    """
+    Rolling health statistics and circuit breaker state for a single data source.
+    Shared across requests, so every update is taken under a lock.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.ewma_latency = None # Unknown until the first call with a measured latency
+        self.error_rate = 0.0
+        self.calls = 0 # Completed calls, successful or not
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """
+        Returns True if a request may be sent to this source right now.
+        An open breaker lets a single half-open probe through once the cooldown has passed.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= BREAKER_COOLDOWN_SECONDS:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def _record_latency(self, latency: float):
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = (1 - HEALTH_EWMA_ALPHA) * self.ewma_latency + HEALTH_EWMA_ALPHA * latency
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self._record_latency(latency)
+            self.calls += 1
+            self.error_rate = (1 - HEALTH_EWMA_ALPHA) * self.error_rate
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                logger.info("Source '%s' recovered. Circuit closed.", self.name)
+            self.state = self.CLOSED
+            self.probe_in_flight = False
+
+    def record_failure(self, latency: float = None):
+        """
+        Records a failed call. Pass the elapsed time as `latency`, so slow failures and timeouts
+        count towards the latency estimate and the adaptive timeout can grow.
+        """
+        with self._lock:
+            if latency is not None:
+                self._record_latency(latency)
+            self.calls += 1
+            self.error_rate = (1 - HEALTH_EWMA_ALPHA) * self.error_rate + HEALTH_EWMA_ALPHA
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+                if self.state != self.OPEN:
+                    logger.warning("Source '%s' is failing. Circuit opened.", self.name)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self.probe_in_flight = False
+
+    def release_probe(self):
+        """
+        Frees a half-open probe slot whose call ended without an outcome (e.g. it was cancelled).
+        """
+        with self._lock:
+            self.probe_in_flight = False
+
+    def timeout(self) -> float:
+        """
+        The per-call timeout, adapted to the latency this source has shown recently.
+        """
+        if self.ewma_latency is None:
+            return SOURCE_TIMEOUT_MAX_SECONDS
+        return min(SOURCE_TIMEOUT_MAX_SECONDS, max(SOURCE_TIMEOUT_MIN_SECONDS, self.ewma_latency * SOURCE_TIMEOUT_MULTIPLIER))
+
+    def routing_cost(self) -> float:
+        """
+        Lower is better: expected latency per successful answer. Sources that were never called
+        cost nothing so they get sampled early; sources without a latency sample use a default.
+        """
+        with self._lock:
+            if self.calls == 0:
+                return 0.0
+            latency = self.ewma_latency if self.ewma_latency is not None else SOURCE_DEFAULT_LATENCY_SECONDS
+            return latency / max(1.0 - self.error_rate, MIN_SUCCESS_RATE)
+
+source_health = {name: SourceHealth(name) for name in DATA_SOURCES}
+
+def choose_source(exclude=()):
+    """
+    Picks the fastest source whose circuit breaker currently admits a request.
+    Returns None if every source is unavailable.
+    """
+    for health in sorted(source_health.values(), key=lambda h: h.routing_cost()):
+        if health.name not in exclude and health.try_acquire():
+            return health.name
+    return None
+
+def compute_source_reputation(used_sources):
+    """
+    Summarizes the recent reliability of the sources that contributed to a response.
+    """
+    if not used_sources:
+        return "no_source_available"
+    average_error_rate = sum(source_health[name].error_rate for name in used_sources) / len(used_sources)
+    if average_error_rate < 0.1:
+        return "reliable_sources"
+    if average_error_rate < 0.5:
+        return "mixed_sources"
+    return "unreliable_sources"
+
 async def fetch_data(prompt, user_preferences):
     """
     The main entry point for the data sourcing module.
     It orchestrates the parallel scraping swarm.
     """
-    print(f"Dispatcher: Received request for prompt '{prompt[:30]}...'")
+    logger.info("Received request for prompt '%s...'", prompt[:30])
 
     # --- 1. Hypothesis Expansion ---
     # Use the Question Analyst to break down the prompt.
     sub_questions = expand_question(prompt)
 
     # --- 2. Swarm Configuration ---
-    # Create a scraping task for each sub-question.
-    tasks = []
-    for q in sub_questions:
-        # We can add logic here to query different sources for different questions.
-        # For now, each question will be scraped from a simulated source.
-        tasks.append(placeholder_scraper(f"Source for '{q[:20]}...'", q, delay=0.7))
+    # Each sub-question is routed to the fastest healthy source, failing over to the next one.
+    tasks = [scrape_sub_question(q) for q in sub_questions]
 
     # --- Execute the Resilient Swarm ---
-    print("Dispatcher: Deploying Resilient Scraping Swarm...")
+    logger.debug("Deploying Resilient Scraping Swarm...")
     # By setting return_exceptions=True, gather will not stop if one task fails.
     results = await asyncio.gather(*tasks, return_exceptions=True)
-    print("Dispatcher: Swarm has returned.")
+    logger.debug("Swarm has returned.")
 
     # --- Process results, filtering out exceptions ---
     successful_results = []
+    used_sources = set()
     for res in results:
         if isinstance(res, Exception):
-            # Auto-debug and log the error
-            print(f"Dispatcher Log (Auto-Debug): A swarm agent failed. Reason: {res}")
+            # Auto-debug and log the error (every source has already been tried)
+            logger.warning("Auto-Debug: A swarm agent failed. Reason: %r", res)
         else:
-            successful_results.append(res)
+            source_name, data = res
+            used_sources.add(source_name)
+            successful_results.append(data)
 
     # --- Consolidate and Return ---
     # Combine the successful results.
     if not successful_results:
-        print("Dispatcher Warning: All swarm agents failed.")
+        logger.error("All swarm agents failed.")
         return "Could not retrieve any data.", "no_source_available"
 
     consolidated_data = " | ".join(filter(None, successful_results))
 
-    # For now, we return a fixed reputation. Later, this will be source-dependent.
-    source_reputation = "mixed_sources"
+    # The reputation reflects the recent health of the sources that actually answered.
+    source_reputation = compute_source_reputation(used_sources)
 
     return consolidated_data, source_reputation
 
 
+async def scrape_sub_question(question):
+    """
+    Tries the healthy sources in order of speed until one answers the sub-question.
+    Returns a (source_name, data) tuple so the caller knows which source answered.
+    """
+    tried = set()
+    last_error = None
+    while True:
+        source_name = choose_source(exclude=tried)
+        if source_name is None:
+            raise last_error or ConnectionError(f"No healthy source available for '{question[:20]}...'")
+        tried.add(source_name)
+        try:
+            return await scrape_with_health(source_name, question)
+        except Exception as e:
+            logger.warning("Auto-Debug: Source '%s' failed, failing over. Reason: %r", source_name, e)
+            last_error = e
+
+
+async def scrape_with_health(source_name, prompt):
+    """
+    Runs a scraper under the source's adaptive timeout and feeds the outcome into its health stats.
+    """
+    health = source_health[source_name]
+    started = time.monotonic()
+    recorded = False
+    try:
+        data = await asyncio.wait_for(
+            placeholder_scraper(source_name, prompt, **DATA_SOURCES[source_name]),
+            timeout=health.timeout()
+        )
+        latency = time.monotonic() - started
+        health.record_success(latency)
+        recorded = True
+    except asyncio.TimeoutError:
+        health.record_failure(latency=time.monotonic() - started)
+        recorded = True
+        raise
+    except Exception:
+        health.record_failure(latency=time.monotonic() - started)
+        recorded = True
+        raise
+    finally:
+        # A cancelled call says nothing about the source, but must not hold its half-open probe forever.
+        if not recorded:
+            health.release_probe()
+    logger.debug("Swarm Agent [%s]: Answered '%s...' in %.3fs.", source_name, prompt[:20], latency)
+    return source_name, data
+
+
 async def placeholder_scraper(source_name, prompt, delay, should_fail=False):
     """
     A placeholder function to simulate a scraper for a specific data source.
     It can now be instructed to fail to test our resilience logic.
     """
-    print(f"Swarm Agent [{source_name}]: Starting scrape for '{prompt[:20]}...'")
     await asyncio.sleep(delay)  # Simulate network latency
 
     if should_fail:
-        print(f"Swarm Agent [{source_name}]: FAILED deliberately for testing.")
+        logger.debug("Swarm Agent [%s]: FAILED deliberately for testing.", source_name)
         raise ConnectionError(f"Failed to connect to {source_name}")
 
     result = f"Data from {source_name} about '{prompt}'"
-    print(f"Swarm Agent [{source_name}]: Scrape complete.")
     return result
 
 # --- Main execution for testing ---
@@ -4,6 +4,10 @@
 import requests
 import os
 
+from ..observability.logger import get_logger
+
+logger = get_logger("image_curator")
+
 # --- Configuration ---
 # In a real-world scenario, you would hide this in an environment variable.
 # For this project, we'll retrieve it from an environment variable for best practice.
@@ -16,7 +20,7 @@ def get_relevant_image(text_response: str, keywords: list = None):
     It will prioritize provided keywords, otherwise, it will try to extract them.
     """
     if not PEXELS_API_KEY or PEXELS_API_KEY == "YOUR_DEFAULT_PEXELS_API_KEY":
-        print("Image Curator: PEXELS_API_KEY not found. Skipping image search.")
+        logger.debug("PEXELS_API_KEY not found. Skipping image search.")
         return None # Return None if the API key is not set
 
     # 1. Determine the search query
@@ -31,7 +35,7 @@ def get_relevant_image(text_response: str, keywords: list = None):
     if not query:
         return None
 
-    print(f"Image Curator: Searching for image with query: '{query}'")
+    logger.debug("Searching for image with query: '%s'", query)
 
     # 2. Make the API request to Pexels
     headers = {"Authorization": PEXELS_API_KEY}
@@ -46,14 +50,14 @@ def get_relevant_image(text_response: str, keywords: list = None):
         # 3. Extract the image URL
         if data.get("photos") and len(data["photos"]) > 0:
             image_url = data["photos"][0]["src"]["medium"] # Get a medium-sized image
-            print(f"Image Curator: Found image URL: {image_url}")
+            logger.info("Found image URL: %s", image_url)
             return image_url
         else:
-            print("Image Curator: No image found for the query.")
+            logger.info("No image found for the query.")
             return None
 
     except requests.exceptions.RequestException as e:
-        print(f"Image Curator ERROR: Failed to connect to Pexels API: {e}")
+        logger.error("Failed to connect to Pexels API: %s", e)
         return None
 
 # --- Simple Test ---
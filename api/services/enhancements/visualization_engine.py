@@ -6,6 +6,10 @@ import os
 # import rpy2.robjects as robjects
 # from rpy2.robjects.packages import importr
 
+from ..observability.logger import get_logger
+
+logger = get_logger("visualization_engine")
+
 # --- Placeholder for the "Visualization Analyst" AI Agent ---
 def analyze_visualization_request(prompt: str):
     """
@@ -18,7 +22,7 @@ def analyze_visualization_request(prompt: str):
     if "bar chart" not in prompt_lower and "graph" not in prompt_lower:
         return None # Not a visualization request
 
-    print("Visualization Analyst: Detected a request for a bar chart.")
+    logger.info("Visualization Analyst: Detected a request for a bar chart.")
 
     # Placeholder data extraction. A real AI would parse this from the prompt.
     # e.g., "Make a bar chart showing Dhaka with 100, and Chittagong with 60"
@@ -30,7 +34,7 @@ def analyze_visualization_request(prompt: str):
         },
         "title": "City Population Comparison"
     }
-    print(f"Visualization Analyst: Extracted data and title: {extracted_data}")
+    logger.debug("Visualization Analyst: Extracted data and title: %s", extracted_data)
     return extracted_data
 
 
@@ -40,7 +44,7 @@ def generate_graph_with_r(viz_details: dict):
     Generates an R script using ggplot2 and executes it to create a graph image.
     NOTE: This requires R, ggplot2, and the Python library 'rpy2' to be installed.
     """
-    print("Visualization Engine: Generating graph with R...")
+    logger.debug("Generating graph with R...")
 
     # --- This is a simulation of the Rpy2 logic ---
     # In a real environment, we would use rpy2 to execute R code.
@@ -71,7 +75,7 @@ def generate_graph_with_r(viz_details: dict):
     # We will just return a placeholder path for now.
     # In a real system, this file would have just been created by the R script.
     output_filepath = "/api/static/placeholder_graph.png" # Using a placeholder
-    print(f"Visualization Engine: Successfully generated graph at {output_filepath}")
+    logger.info("Successfully generated graph at %s", output_filepath)
 
     return output_filepath
 
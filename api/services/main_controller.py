@@ -15,30 +15,57 @@ from .enhancements.image_curator import get_relevant_image
 from .enhancements.visualization_engine import create_visualization
 # Import the research suite agents
 from .agents.research_suite import fact_check_data
+# Import the admission controller for the live-generation path
+from .admission_controller import live_slot
+# Import the logging subsystem
+from .observability.logger import get_logger
+
+logger = get_logger("main_controller")
+
+# Outcomes of the live pipeline that are NOT archived (a refresh with either leaves the old entry in place).
+SECURITY_BLOCK_MODEL = "Security Block"
+NO_SOURCE_MODEL = "No Source Available"
 
 async def process_request(prompt: str, mode: str, user_preferences: dict):
     """
     The new central function to handle a user's request.
     It orchestrates the workflow with a focus on speed ("Archive First").
+    Returns (response_payload, model_used, diagnostic_report, etag); etag is only set for archive-served answers.
     """
     # 1. "Archive First" Policy for maximum speed.
     # Check the internal archive first based on the prompt.
     archive_result = find_in_archive(prompt)
     if archive_result:
+        logger.info("Archive hit. Serving stored response.")
         # Return the found data immediately for a 1-3 second response time.
-        return archive_result['response'], "Eternal Archive (Local)", "Fast retrieval from archive."
+        return archive_result['response'], "Eternal Archive (Local)", "Fast retrieval from archive.", archive_result.get('etag')
 
     # If not in archive, proceed with the rest of the workflow.
-    # 2. (Future) Log the request and apply initial security checks.
+    # 2. Admission control: live generation is expensive, so it only runs when a slot for
+    #    this mode is free. Raises AdmissionRejected when the request has to be shed.
+    logger.info("Archive miss. Requesting a live slot (mode: %s).", mode)
+    async with live_slot(mode):
+        return await run_live_pipeline(prompt, mode, user_preferences)
 
+async def run_live_pipeline(prompt: str, mode: str, user_preferences: dict):
+    """
+    The live-generation workflow: fetch, scan, fact-check, enhance and archive.
+    """
     # 3. Fetch data from external sources via the dispatcher.
     raw_data, source_reputation = await fetch_data(prompt, user_preferences)
+    if source_reputation == "no_source_available":
+        # Every source failed or is circuit-broken: do NOT archive the placeholder text.
+        logger.warning("No data source answered. Skipping archiving.")
+        response_payload = {"text": "I could not reach any data sources right now. Please try again shortly.", "image_url": None}
+        return response_payload, NO_SOURCE_MODEL, "All data sources failed or are temporarily disabled.", None
 
     # 4. Scan the fetched data using The Gatekeeper.
     safe_data, gatekeeper_report = scan_data(raw_data, source_reputation)
     if not safe_data:
         # If data is blocked, inform the user and do NOT archive it.
-        return "I could not find safe and reliable information for your query.", "Security Block", gatekeeper_report
+        logger.warning("Gatekeeper blocked the fetched data: %s", gatekeeper_report)
+        response_payload = {"text": "I could not find safe and reliable information for your query.", "image_url": None}
+        return response_payload, SECURITY_BLOCK_MODEL, gatekeeper_report, None
 
     # 5. Fact-check the consolidated data.
     verified_data = fact_check_data(safe_data)
@@ -72,4 +99,4 @@ async def process_request(prompt: str, mode: str, user_preferences: dict):
     model_used = f"Central Controller (Mode: {mode})"
     diagnostic = "Successfully routed through the new main_controller."
 
-    return response_payload, model_used, diagnostic
+    return response_payload, model_used, diagnostic, None
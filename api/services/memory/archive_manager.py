@@ -1,40 +1,108 @@
 # This file will manage the "Eternal Archive", our system's long-term memory.
 import json
 import os
+import gzip
+import base64
 import hashlib
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+
+from ..observability.logger import get_logger
+
+# Optional: zstd compresses faster and smaller than gzip, but gzip is always available.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # --- Configuration ---
 ARCHIVE_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'archive_index.json') # Store it in the root `api` folder
+# The cold tier holds rarely used entries with compressed payloads, one file per entry,
+# so moving or reading a cold entry never touches the rest of the tier.
+COLD_ARCHIVE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'archive_cold')
+
+# Hard caps for each tier. Going over a hot cap demotes entries to the cold tier,
+# going over the cold cap evicts entries from the archive entirely.
+HOT_TIER_MAX_ENTRIES = int(os.environ.get("ARCHIVE_HOT_MAX_ENTRIES", "500"))
+HOT_TIER_MAX_BYTES = int(os.environ.get("ARCHIVE_HOT_MAX_BYTES", str(2 * 1024 * 1024)))
+COLD_TIER_MAX_BYTES = int(os.environ.get("ARCHIVE_COLD_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# "The Archivist" compacts incrementally: at most this many entries are moved per pass.
+COMPACTION_BATCH_SIZE = int(os.environ.get("ARCHIVE_COMPACTION_BATCH_SIZE", "50"))
+COMPACTION_INTERVAL_SECONDS = float(os.environ.get("ARCHIVE_COMPACTION_INTERVAL", "60"))
+COMPRESSION_CODEC = "zstd" if zstandard is not None else "gzip"
+
+# How long an answer stays fresh. Stale answers are still served, but trigger a background refresh.
+ARCHIVE_ENTRY_TTL_SECONDS = int(os.environ.get("ARCHIVE_ENTRY_TTL", str(7 * 24 * 3600)))
+
+logger = get_logger("archive_manager")
+
+# Requests and the background compactor share the archive files.
+_archive_lock = threading.RLock()
+
+# Archive files that failed verification. They are never overwritten, so they can be recovered by hand.
+_unverified_paths = set()
+
+# Accesses not yet written to disk: entry_id -> (count, last_accessed). Archive hits only
+# record them in memory; the compactor merges them into the hot file on its next save and
+# writes those of cold entries to their files.
+_pending_accesses = {}
+
+# The verified entries of the hot file, kept in step with it by save_archive, so archive hits
+# and conditional lookups never have to load, verify or rewrite the archive. Their access
+# statistics include the pending accesses.
+_hot_entries = None
+
+# Metadata (everything but the payload, plus the file size) of every cold entry, so the cold
+# tier can be ranked and sized without reading it. Built from COLD_ARCHIVE_DIR on first use.
+_cold_index = None
+
+# Called with the prompt of a stale entry so it can be refreshed in the background.
+# Registered by the archive refresher; stale entries are simply served while it is unset.
+_refresh_handler = None
 
 # --- Core Archive Functions ---
 
-def load_archive():
+def load_archive(path=ARCHIVE_FILE_PATH):
     """
     Loads the entire archive from the JSON file.
     Includes verification using "The Verifier".
     """
-    if not os.path.exists(ARCHIVE_FILE_PATH):
-        return {"entries": {}, "metadata": {}} # Return a clean slate if no archive exists
+    if not os.path.exists(path):
+        return {} # Return a clean slate if no archive exists
 
-    with open(ARCHIVE_FILE_PATH, 'r') as f:
-        archive_data = json.load(f)
+    try:
+        with open(path, 'r') as f:
+            archive_data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Archive file %s could not be read: %s", path, e)
+        archive_data = None
 
     # "The Verifier": Check data integrity
-    if not verify_archive_integrity(archive_data):
-        print("WARNING: Archive integrity check failed! The file may be corrupted.")
-        # We could either return empty or try to use the partial data.
-        # For safety, we'll return an empty state.
-        return {"entries": {}, "metadata": {}}
+    if not isinstance(archive_data, dict) or not verify_archive_integrity(archive_data):
+        logger.warning("Archive integrity check failed! The file may be corrupted. It will not be overwritten.")
+        # For safety, we'll return an empty state and leave the file untouched for recovery.
+        _unverified_paths.add(path)
+        return {}
 
-    print("Archive loaded and verified successfully.")
+    _unverified_paths.discard(path)
+    logger.debug("Archive loaded and verified successfully.")
     return archive_data.get("entries", {})
 
-def save_archive(entries, metadata):
+def save_archive(entries, metadata, path=ARCHIVE_FILE_PATH):
     """
     Saves the archive data to the JSON file.
     Includes integrity hash generation for "The Verifier".
+    Refuses to overwrite a file that failed verification when it was loaded.
     """
+    if path in _unverified_paths:
+        logger.error("Refusing to overwrite %s, which failed its integrity check.", path)
+        return
+
+    if path == ARCHIVE_FILE_PATH:
+        with _archive_lock:
+            _apply_pending_accesses(entries, consume=True)
+
     archive_data = {
         "entries": entries,
         "metadata": metadata
@@ -43,9 +111,42 @@ def save_archive(entries, metadata):
     # "The Verifier": Generate hash before saving
     archive_data["metadata"]["hash"] = generate_data_hash(entries)
 
-    with open(ARCHIVE_FILE_PATH, 'w') as f:
-        json.dump(archive_data, f, indent=4)
-    print("Archive saved successfully.")
+    _write_json_atomic(path, archive_data)
+    if path == ARCHIVE_FILE_PATH:
+        _set_hot_entries(entries)
+    logger.debug("Archive saved successfully.")
+
+def _set_hot_entries(entries):
+    global _hot_entries
+    _hot_entries = {}
+    for entry_id, entry in entries.items():
+        if not isinstance(entry, dict) or "response" not in entry:
+            continue
+        _hot_entries[entry_id] = dict(entry)
+        # Entries from before ETags existed get theirs computed once, here.
+        if "etag" not in entry:
+            _hot_entries[entry_id]["etag"] = compute_entry_etag(entry_id, entry["response"])
+
+def _get_hot_entries():
+    """
+    Returns the hot tier's entries, loading the hot file once on first use.
+    """
+    with _archive_lock:
+        if _hot_entries is None:
+            _set_hot_entries(load_archive())
+        return _hot_entries
+
+def _write_json_atomic(path, data):
+    """
+    Writes JSON to a temporary file and moves it into place, so a crash never leaves a truncated file.
+    """
+    temp_path = f"{path}.tmp"
+    # Compact separators: indentation roughly doubled the file size for long answers.
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
 
 
 def add_to_archive(prompt, response_data, source, keywords=None):
@@ -57,41 +158,437 @@ def add_to_archive(prompt, response_data, source, keywords=None):
     if keywords is None:
         keywords = [] # Default to an empty list
 
-    archive_entries = load_archive()
+    with _archive_lock:
+        archive_entries = load_archive()
 
-    # "The Librarian": Structure the data
-    entry_id = hashlib.sha256(prompt.encode()).hexdigest() # Use a hash of the prompt as a unique ID
+        # "The Librarian": Structure the data
+        entry_id = hashlib.sha256(prompt.encode()).hexdigest() # Use a hash of the prompt as a unique ID
+        # A refreshed answer keeps the usage statistics of the one it replaces.
+        previous = archive_entries.get(entry_id)
+        if previous is None:
+            previous = _get_cold_index().get(entry_id) or {}
+            # The cold index record already counts its pending accesses.
+            _pending_accesses.pop(entry_id, None)
+        now = datetime.utcnow().isoformat()
 
-    archive_entries[entry_id] = {
-        "prompt": prompt,
-        "response": response_data,
-        "source": source,
-        "keywords": keywords, # "The Curation Engine" input
-        "timestamp": datetime.utcnow().isoformat(),
-        "access_count": 1
-    }
+        archive_entries[entry_id] = {
+            "prompt": prompt,
+            "response": response_data,
+            "source": source,
+            "keywords": keywords, # "The Curation Engine" input
+            "timestamp": now,
+            "ttl_seconds": ARCHIVE_ENTRY_TTL_SECONDS,
+            "access_count": previous.get("access_count", 1),
+            "last_accessed": previous.get("last_accessed", now),
+            "etag": compute_entry_etag(entry_id, response_data) # Identifies this exact answer for HTTP caching
+        }
+
+        # Update metadata and save
+        metadata = {"last_updated": datetime.utcnow().isoformat()}
+        save_archive(archive_entries, metadata)
+        # The new answer supersedes any cold copy.
+        if entry_id in _get_cold_index():
+            delete_cold_entry(entry_id)
+    logger.info("New entry for prompt '%s...' added to archive.", prompt[:30])
 
-    # Update metadata and save
-    metadata = {"last_updated": datetime.utcnow().isoformat()}
-    save_archive(archive_entries, metadata)
-    print(f"New entry for prompt '{prompt[:30]}...' added to archive.")
+    # The new entry may have pushed the hot tier over its caps.
+    request_compaction()
 
 def find_in_archive(prompt):
     """
     Searches for a prompt in the archive.
+    Hot entries are served from memory; cold entries are decompressed and promoted back to the hot tier.
+    Stale entries are returned as well ("stale-while-revalidate"), and a background refresh is requested.
+    """
+    entry_id = hashlib.sha256(prompt.encode()).hexdigest()
+
+    with _archive_lock:
+        entry = _get_hot_entries().get(entry_id)
+        if entry:
+            logger.info("Found match for '%s...' in archive.", prompt[:30])
+            # Update access statistics for tiering and pre-warming; the compactor writes them to disk.
+            _record_access(entry_id, entry)
+            entry = dict(entry)
+        else:
+            cold_record = _get_cold_index().get(entry_id)
+            cold_entry = load_cold_entry(entry_id) if cold_record else None
+            if not cold_entry:
+                return None
+            _record_access(entry_id, cold_record)
+            entry = _apply_pending_accesses({entry_id: thaw_entry(cold_entry)})[entry_id]
+
+            if ARCHIVE_FILE_PATH in _unverified_paths:
+                # The hot file cannot be written, so the entry stays cold.
+                logger.info("Found match for '%s...' in cold archive.", prompt[:30])
+            else:
+                logger.info("Found match for '%s...' in cold archive. Promoting to hot tier.", prompt[:30])
+                archive_entries = load_archive()
+                archive_entries[entry_id] = thaw_entry(cold_entry)
+                # Saving merges the pending accesses, including this one.
+                save_archive(archive_entries, {"last_updated": datetime.utcnow().isoformat()})
+                delete_cold_entry(entry_id)
+                # The promotion may have pushed the hot tier over its caps.
+                request_compaction()
+
+    if is_entry_stale(entry) and _refresh_handler is not None:
+        logger.info("Entry for '%s...' is stale. Serving it while a refresh runs.", prompt[:30])
+        _refresh_handler(prompt)
+    return entry
+
+def touch_archive_entry(prompt):
+    """
+    Records an access that was answered without loading the entry (e.g. a 304 revalidation),
+    and requests a refresh if the entry is stale, just like find_in_archive would.
+    """
+    entry_id = hashlib.sha256(prompt.encode()).hexdigest()
+
+    with _archive_lock:
+        record = _get_hot_entries().get(entry_id) or _get_cold_index().get(entry_id)
+        if not record:
+            return
+        _record_access(entry_id, record)
+
+    if is_entry_stale(record) and _refresh_handler is not None:
+        logger.info("Revalidated entry for '%s...' is stale. Requesting a refresh.", prompt[:30])
+        _refresh_handler(prompt)
+
+def _record_access(entry_id, record):
+    """
+    Counts an access in the in-memory record (hot entry or cold index record) and queues it
+    for the compactor to write to disk. Must be called with the archive lock held.
+    """
+    now = datetime.utcnow().isoformat()
+    count, _ = _pending_accesses.get(entry_id, (0, now))
+    _pending_accesses[entry_id] = (count + 1, now)
+    record["access_count"] = record.get("access_count", 0) + 1
+    record["last_accessed"] = now
+    # Make sure someone flushes the pending accesses, even if nothing is ever added.
+    _start_compactor()
+
+def _apply_pending_accesses(entries, consume=False):
+    """
+    Folds accesses that are not on disk yet into `entries`.
+    With consume=True they are removed from the pending set (used when the hot file is saved).
+    Must be called with the archive lock held.
+    """
+    for entry_id, (count, last_accessed) in list(_pending_accesses.items()):
+        entry = entries.get(entry_id)
+        if not isinstance(entry, dict):
+            continue
+        entries[entry_id] = _merge_accesses(entry, count, last_accessed)
+        if consume:
+            del _pending_accesses[entry_id]
+    return entries
+
+def _merge_accesses(entry, count, last_accessed):
+    return dict(
+        entry,
+        access_count=entry.get("access_count", 0) + count,
+        last_accessed=max(entry.get("last_accessed", ""), last_accessed)
+    )
+
+def _flush_pending_accesses(hot_entries, cold_index):
+    """
+    Writes pending accesses of cold entries into their files and forgets those of entries that
+    have left the archive. Pending accesses of hot entries are left for save_archive.
+    Must be called with the archive lock held.
+    """
+    for entry_id, (count, last_accessed) in list(_pending_accesses.items()):
+        if entry_id in hot_entries:
+            continue
+        if entry_id in cold_index:
+            cold_entry = load_cold_entry(entry_id)
+            if cold_entry:
+                cold_index[entry_id]["size"] = save_cold_entry(entry_id, _merge_accesses(cold_entry, count, last_accessed))
+        del _pending_accesses[entry_id]
+
+def snapshot_archive():
+    """
+    Returns a consistent copy of the hot tier's entries, for background jobs like the pre-warmer.
+    Includes accesses that have not been written to disk yet.
+    """
+    with _archive_lock:
+        return {entry_id: dict(entry) for entry_id, entry in _get_hot_entries().items()}
+
+def set_refresh_handler(handler):
+    """
+    Registers the function that refreshes stale entries. It must not block.
+    """
+    global _refresh_handler
+    _refresh_handler = handler
+
+# --- Freshness ---
+
+def entry_expires_at(entry):
+    """
+    When an entry goes stale. Entries from before TTLs existed use the current default TTL.
+    """
+    ttl_seconds = entry.get("ttl_seconds", ARCHIVE_ENTRY_TTL_SECONDS)
+    return datetime.fromisoformat(entry["timestamp"]) + timedelta(seconds=ttl_seconds)
+
+def is_entry_stale(entry, lead_seconds=0):
+    """
+    True if the entry is stale, or will be within `lead_seconds`.
+    """
+    return datetime.utcnow() + timedelta(seconds=lead_seconds) >= entry_expires_at(entry)
+
+def find_archive_etag(prompt):
+    """
+    Returns the ETag of the archived answer for a prompt, or None.
+    Answered from the in-memory indexes, so conditional requests never load the archive.
     """
-    archive_entries = load_archive()
     entry_id = hashlib.sha256(prompt.encode()).hexdigest()
 
-    entry = archive_entries.get(entry_id)
-    if entry:
-        print(f"Found match for '{prompt[:30]}...' in archive.")
-        # Update access count for usage statistics
-        entry["access_count"] += 1
-        save_archive(archive_entries, {"last_updated": datetime.utcnow().isoformat()})
-        return entry
+    with _archive_lock:
+        record = _get_hot_entries().get(entry_id) or _get_cold_index().get(entry_id)
+    if not record:
+        return None
+    return record.get("etag")
+
+def compute_entry_etag(entry_id, response_data):
+    """
+    A strong ETag for an archived answer: changes whenever the stored response changes.
+    """
+    serialized_data = json.dumps(response_data, sort_keys=True)
+    return hashlib.sha256(f"{entry_id}:{serialized_data}".encode()).hexdigest()[:32]
+
+# --- Payload Compression ---
+
+def compress_payload(payload):
+    """
+    Compresses a JSON-serializable payload into a storable {"codec", "data"} object.
+    """
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    if COMPRESSION_CODEC == "zstd":
+        data = zstandard.ZstdCompressor().compress(raw)
+    else:
+        data = gzip.compress(raw)
+    return {"codec": COMPRESSION_CODEC, "data": base64.b64encode(data).decode('ascii')}
+
+def decompress_payload(blob):
+    """
+    Reverses compress_payload, using the codec recorded alongside the data.
+    """
+    data = base64.b64decode(blob["data"])
+    if blob["codec"] == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Archive entry is zstd-compressed but the 'zstandard' package is not installed.")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raw = gzip.decompress(data)
+    return json.loads(raw)
+
+def freeze_entry(entry):
+    """
+    Converts a hot entry into its cold form by compressing the response payload.
+    """
+    cold_entry = {key: value for key, value in entry.items() if key != "response"}
+    cold_entry["compressed_response"] = compress_payload(entry.get("response"))
+    return cold_entry
+
+def thaw_entry(cold_entry):
+    """
+    Converts a cold entry back into a regular hot entry.
+    """
+    entry = {key: value for key, value in cold_entry.items() if key != "compressed_response"}
+    entry["response"] = decompress_payload(cold_entry["compressed_response"])
+    return entry
+
+# --- Cold Tier Storage ---
+
+def _cold_entry_path(entry_id):
+    return os.path.join(COLD_ARCHIVE_DIR, f"{entry_id}.json")
+
+def load_cold_entry(entry_id):
+    """
+    Loads and verifies a single cold entry. Returns None if it is missing or corrupted.
+    """
+    path = _cold_entry_path(entry_id)
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Cold entry %s could not be read: %s", entry_id, e)
+        return None
+
+    # "The Verifier": each cold entry carries its own hash
+    if not isinstance(data, dict) or data.get("hash") != generate_data_hash(data.get("entry")):
+        logger.warning("Cold entry %s failed its integrity check. Leaving it in place.", entry_id)
+        return None
+    return data["entry"]
+
+def save_cold_entry(entry_id, cold_entry):
+    """
+    Writes a single cold entry and returns its size on disk.
+    """
+    os.makedirs(COLD_ARCHIVE_DIR, exist_ok=True)
+    path = _cold_entry_path(entry_id)
+    _write_json_atomic(path, {"entry": cold_entry, "hash": generate_data_hash(cold_entry)})
+    return os.path.getsize(path)
+
+def delete_cold_entry(entry_id):
+    with _archive_lock:
+        _get_cold_index().pop(entry_id, None)
+        _pending_accesses.pop(entry_id, None)
+        try:
+            os.remove(_cold_entry_path(entry_id))
+        except FileNotFoundError:
+            pass
+
+def _cold_index_record(cold_entry, size):
+    record = {key: value for key, value in cold_entry.items() if key != "compressed_response"}
+    record["size"] = size
+    return record
+
+def _get_cold_index():
+    """
+    Returns the cold tier's metadata index, reading the cold directory once on first use.
+    """
+    global _cold_index
+    with _archive_lock:
+        if _cold_index is None:
+            _cold_index = {}
+            if os.path.isdir(COLD_ARCHIVE_DIR):
+                for name in os.listdir(COLD_ARCHIVE_DIR):
+                    if not name.endswith(".json"):
+                        continue
+                    entry_id = name[:-len(".json")]
+                    cold_entry = load_cold_entry(entry_id)
+                    if cold_entry:
+                        _cold_index[entry_id] = _cold_index_record(cold_entry, os.path.getsize(_cold_entry_path(entry_id)))
+        return _cold_index
+
+# --- Compaction ("The Archivist") ---
+
+def _entry_rank(entry, recent_cutoff):
+    """
+    Ranks entries for tiering: least used, then least recently used, sorts first.
+    Entries used since `recent_cutoff` (e.g. just promoted) sort after all others, so they
+    are not moved straight back.
+    """
+    last_accessed = entry.get("last_accessed", entry.get("timestamp", ""))
+    return (last_accessed >= recent_cutoff, entry.get("access_count", 0), last_accessed)
+
+def _entry_size(entry):
+    return len(json.dumps(entry, separators=(',', ':')))
+
+def compact_archive(max_moves=COMPACTION_BATCH_SIZE):
+    """
+    Runs one incremental compaction pass.
+    Demotes the lowest-ranked hot entries to the cold tier while the hot caps are exceeded,
+    then evicts the lowest-ranked cold entries while the cold cap is exceeded.
+    At most `max_moves` entries are moved per pass. Compression and cold-tier writes happen
+    outside the archive lock, so requests are only held up while the (capped) hot tier is rewritten.
+    """
+    # 1. Choose what to demote from the hot file, ranked by the in-memory access statistics.
+    with _archive_lock:
+        hot_entries = load_archive()
+        hot_stats = snapshot_archive()
+
+    # Older versions of the archive could store non-entry objects in the index; drop them.
+    malformed = [key for key, value in hot_entries.items() if not isinstance(value, dict) or "prompt" not in value]
+    for key in malformed:
+        del hot_entries[key]
 
-    return None
+    # Entries used within the last compaction interval are only moved if nothing else will do.
+    recent_cutoff = (datetime.utcnow() - timedelta(seconds=COMPACTION_INTERVAL_SECONDS)).isoformat()
+    hot_sizes = {key: _entry_size(value) for key, value in hot_entries.items()}
+    hot_bytes = sum(hot_sizes.values())
+    hot_count = len(hot_entries)
+    candidates = []
+    for entry_id in sorted(hot_entries, key=lambda key: _entry_rank(hot_stats.get(key, hot_entries[key]), recent_cutoff)):
+        if hot_count <= HOT_TIER_MAX_ENTRIES and hot_bytes <= HOT_TIER_MAX_BYTES:
+            break
+        if len(candidates) >= max_moves:
+            break
+        candidates.append(entry_id)
+        hot_count -= 1
+        hot_bytes -= hot_sizes[entry_id]
+
+    # 2. Compress and write the cold copies without holding the lock.
+    cold_sizes = {entry_id: save_cold_entry(entry_id, freeze_entry(hot_entries[entry_id])) for entry_id in candidates}
+
+    # 3. Drop the demoted entries from the hot tier, unless they were used or refreshed in the meantime.
+    demoted = 0
+    with _archive_lock:
+        current_entries = load_archive()
+        for key in malformed:
+            current_entries.pop(key, None)
+        cold_index = _get_cold_index()
+        for entry_id in candidates:
+            if current_entries.get(entry_id) == hot_entries[entry_id]:
+                del current_entries[entry_id]
+                # Pending accesses stay queued and are written to the cold file below.
+                demoted_entry = _apply_pending_accesses({entry_id: hot_entries[entry_id]})[entry_id]
+                cold_index[entry_id] = _cold_index_record(demoted_entry, cold_sizes[entry_id])
+                demoted += 1
+        # Saving also flushes the pending accesses of hot entries.
+        if malformed or demoted or any(entry_id in current_entries for entry_id in _pending_accesses):
+            save_archive(current_entries, {"last_updated": datetime.utcnow().isoformat()})
+        _flush_pending_accesses(current_entries, cold_index)
+        # Cold copies that lost the race are stale; the hot entry stays authoritative.
+        for entry_id in candidates:
+            if entry_id not in cold_index:
+                try:
+                    os.remove(_cold_entry_path(entry_id))
+                except FileNotFoundError:
+                    pass
+
+        # 4. Evict from the cold tier while it is over its cap.
+        cold_bytes = sum(record["size"] for record in cold_index.values())
+        evicted = 0
+        for entry_id in sorted(cold_index, key=lambda key: _entry_rank(cold_index[key], recent_cutoff)):
+            if cold_bytes <= COLD_TIER_MAX_BYTES or demoted + evicted >= max_moves:
+                break
+            cold_bytes -= cold_index[entry_id]["size"]
+            delete_cold_entry(entry_id)
+            evicted += 1
+
+    complete = (hot_count <= HOT_TIER_MAX_ENTRIES and hot_bytes <= HOT_TIER_MAX_BYTES
+                and cold_bytes <= COLD_TIER_MAX_BYTES)
+
+    if demoted or evicted:
+        logger.info("Archivist: Demoted %d entries to the cold tier and evicted %d entries.", demoted, evicted)
+    return {"demoted": demoted, "evicted": evicted, "complete": complete}
+
+# --- Background Compactor ---
+
+_compaction_requested = threading.Event()
+_compactor_thread = None
+_compactor_start_lock = threading.Lock()
+
+def request_compaction():
+    """
+    Wakes the background compactor, starting it on first use. Never blocks the caller.
+    """
+    _start_compactor()
+    _compaction_requested.set()
+
+def _start_compactor():
+    global _compactor_thread
+    with _compactor_start_lock:
+        if _compactor_thread is None:
+            _compactor_thread = threading.Thread(target=_compactor_loop, name="archive-compactor", daemon=True)
+            _compactor_thread.start()
+
+def _compactor_loop():
+    """
+    Runs compaction passes on request or every COMPACTION_INTERVAL_SECONDS.
+    Each pass also writes the pending access statistics to disk.
+    Unfinished work is continued with another pass straight away.
+    """
+    while True:
+        _compaction_requested.wait(COMPACTION_INTERVAL_SECONDS)
+        _compaction_requested.clear()
+        try:
+            result = compact_archive()
+        except Exception as e:
+            logger.error("Archivist: Compaction pass failed: %s", e)
+            continue
+        if not result["complete"]:
+            _compaction_requested.set()
 
 # --- Integrity Verification ("The Verifier") ---
 
@@ -108,7 +605,7 @@ def verify_archive_integrity(archive_data):
     Verifies that the archive's data matches its stored hash.
     """
     if "metadata" not in archive_data or "hash" not in archive_data["metadata"]:
-        print("Archive has no metadata or hash. Verification skipped for older/new archives.")
+        logger.debug("Archive has no metadata or hash. Verification skipped for older/new archives.")
         return True # Can't verify, so we assume it's okay for now.
 
     stored_hash = archive_data["metadata"]["hash"]
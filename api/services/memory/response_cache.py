@@ -0,0 +1,83 @@
+# This file keeps ready-to-send response bodies for archive-served answers.
+# Popular answers are serialized and compressed once, then served straight from memory.
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+
+from ..observability.logger import get_logger
+
+# Optional: brotli compresses text better than gzip, but gzip is always available.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# --- Configuration ---
+# Bodies smaller than this are sent uncompressed; compression would not pay for itself.
+COMPRESSION_MIN_BYTES = int(os.environ.get("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+# How many encoded bodies to keep in memory.
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+# Encodings we can produce, in order of preference.
+SUPPORTED_ENCODINGS = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+logger = get_logger("response_cache")
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+# --- Compression ---
+
+def encode_body(raw_body: bytes, encoding):
+    """
+    Compresses a serialized body with the requested encoding if it is large enough.
+    Returns (body, applied_encoding); applied_encoding is None when the body was left as is.
+    """
+    if encoding is None or len(raw_body) < COMPRESSION_MIN_BYTES:
+        return raw_body, None
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(raw_body), "br"
+    if encoding == "gzip":
+        return gzip.compress(raw_body), "gzip"
+    return raw_body, None
+
+def representation_etag(etag, applied_encoding):
+    """
+    Strong ETags must differ between byte-different bodies, so the content coding is appended.
+    """
+    return f"{etag}-{applied_encoding}" if applied_encoding else etag
+
+def strip_etag_coding(tag):
+    """
+    Reverses representation_etag, returning the archive entry's ETag.
+    """
+    for encoding in ("br", "gzip"):
+        if tag.endswith(f"-{encoding}"):
+            return tag[:-len(encoding) - 1]
+    return tag
+
+# --- Pre-encoded Body Cache ---
+
+def get_cached_body(etag, encoding):
+    """
+    Returns the cached (body, applied_encoding) for an archive entry's ETag, or None.
+    """
+    with _cache_lock:
+        key = (etag, encoding)
+        if key not in _cache:
+            return None
+        _cache.move_to_end(key)
+        return _cache[key]
+
+def cache_body(etag, encoding, body, applied_encoding):
+    """
+    Stores an encoded body, evicting the least recently used one when the cache is full.
+    """
+    with _cache_lock:
+        _cache[(etag, encoding)] = (body, applied_encoding)
+        _cache.move_to_end((etag, encoding))
+        while len(_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    logger.debug("Cached %s body for ETag %s.", encoding or "identity", etag)
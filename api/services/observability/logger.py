@@ -0,0 +1,152 @@
+# This file implements the platform's logging subsystem.
+# Log records are handed to a background thread through a queue, so the request path
+# never waits on stdout, and every record carries the trace ID of the request that produced it.
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import uuid
+
+# --- Configuration ---
+# Default level for all modules, e.g. LOG_LEVEL=WARNING
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+# Per-module overrides, e.g. LOG_LEVELS="dispatcher=DEBUG,gatekeeper=WARNING"
+LOG_LEVELS = os.environ.get("LOG_LEVELS", "")
+# Fraction of DEBUG/INFO records kept, globally and per module, e.g. LOG_SAMPLING="dispatcher=0.1"
+# Warnings and errors are never sampled away.
+LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", "1.0"))
+LOG_SAMPLING = os.environ.get("LOG_SAMPLING", "")
+# "text" for human-readable lines, "json" for one JSON object per line.
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text").lower()
+# Records beyond this many waiting in the queue are dropped instead of blocking the caller.
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+
+ROOT_LOGGER_NAME = "athena"
+
+# The trace ID of the request currently being handled. asyncio tasks copy the context
+# they are created in, so every swarm task inherits the ID of its request.
+trace_id_var = contextvars.ContextVar("trace_id", default="-")
+
+_listener = None
+
+# --- Trace IDs ---
+
+def start_trace(trace_id=None):
+    """
+    Sets the trace ID for the current request (generating one if not given) and returns it.
+    """
+    trace_id = trace_id or uuid.uuid4().hex[:16]
+    trace_id_var.set(trace_id)
+    return trace_id
+
+def get_trace_id():
+    return trace_id_var.get()
+
+# --- Filters, Handlers and Formatters ---
+
+class TraceIdFilter(logging.Filter):
+    """
+    Stamps each record with the current trace ID.
+    Runs in the caller's thread, before the record crosses the queue.
+    """
+    def filter(self, record):
+        record.trace_id = trace_id_var.get()
+        return True
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a random fraction of DEBUG/INFO records. Warnings and errors always pass.
+    """
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that drops records when the queue is full rather than blocking or raising.
+    """
+    dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps({
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "trace_id": getattr(record, "trace_id", "-"),
+            "message": record.getMessage(),
+        })
+
+# --- Setup ---
+
+def _parse_overrides(spec):
+    """
+    Parses "module=value,module=value" into a dict.
+    """
+    overrides = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, value = item.split("=", 1)
+            overrides[name.strip()] = value.strip()
+    return overrides
+
+def configure_logging():
+    """
+    Installs the queue handler and starts the background listener. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(trace_id)s] %(name)s: %(message)s"))
+
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(TraceIdFilter())
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(queue_handler)
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+def get_logger(module_name):
+    """
+    Returns the logger for a module, applying its level and sampling overrides.
+    """
+    configure_logging()
+    logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{module_name}")
+
+    level = _parse_overrides(LOG_LEVELS).get(module_name)
+    if level:
+        logger.setLevel(level.upper())
+
+    rate = float(_parse_overrides(LOG_SAMPLING).get(module_name, LOG_SAMPLE_RATE))
+    if rate < 1.0 and not any(isinstance(f, SamplingFilter) for f in logger.filters):
+        logger.addFilter(SamplingFilter(rate))
+
+    return logger
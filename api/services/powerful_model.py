@@ -1,6 +1,10 @@
 # This file is dedicated to handling the powerful, cloud-based AI model.
 from huggingface_hub import InferenceClient
 
+from .observability.logger import get_logger
+
+logger = get_logger("powerful_model")
+
 # --- Configuration ---
 # This is the powerful, open model we use as our primary fallback and synthesizer.
 HUGGING_FACE_MODEL_NAME = "OpenAssistant/oasst-sft-4-pythia-12b-epoch-3.5"
@@ -10,7 +14,7 @@ def generate_powerful_response(prompt: str) -> str:
     MOCKED FUNCTION: Simulates a response from a powerful Hugging Face model.
     This bypasses the network issues in the current environment for submission.
     """
-    print(f"MOCKED POWERFUL MODEL: Simulating response for prompt: '{prompt}'")
+    logger.info("MOCKED POWERFUL MODEL: Simulating response for prompt: '%s'", prompt)
 
     # Check if this is a synthesis task from the agent swarm
     if "Research Report" in prompt:
@@ -1,32 +1,41 @@
 # This file implements "The Gatekeeper", our single, powerful layer of security.
 # It uses a three-phase defense protocol to scan incoming data.
 
+from ..observability.logger import get_logger
+
+logger = get_logger("gatekeeper")
+
 def scan_data(raw_data, source_reputation):
     """
     The main function for The Gatekeeper.
     It orchestrates the three-phase scanning process.
     """
-    print(f"Gatekeeper: Starting scan for data from a source with reputation: {source_reputation}")
+    logger.debug("Starting scan for data from a source with reputation: %s", source_reputation)
+
+    # Nothing was fetched: there is no data to approve, only the dispatcher's placeholder text.
+    if source_reputation == "no_source_available":
+        logger.warning("REJECTED: No data source answered.")
+        return None, "Rejected: no source available"
 
     # Phase 1: "The Sentry" (Static Analysis)
     sentry_passed, sentry_report = phase1_sentry_scan(raw_data)
     if not sentry_passed:
-        print(f"GATEKEEPER REJECTED: Failed Phase 1 (The Sentry). Reason: {sentry_report}")
+        logger.warning("REJECTED: Failed Phase 1 (The Sentry). Reason: %s", sentry_report)
         return None, "Rejected by Sentry"
 
     # Phase 2: "The Interrogator" (Behavioral Analysis)
     interrogator_passed, interrogator_report = phase2_interrogator_scan(raw_data)
     if not interrogator_passed:
-        print(f"GATEKEEPER REJECTED: Failed Phase 2 (The Interrogator). Reason: {interrogator_report}")
+        logger.warning("REJECTED: Failed Phase 2 (The Interrogator). Reason: %s", interrogator_report)
         return None, "Rejected by Interrogator"
 
     # Phase 3: "The Guardian" (Integrity and Sanitization)
     guardian_passed, sanitized_data, guardian_report = phase3_guardian_scan(raw_data)
     if not guardian_passed:
-        print(f"GATEKEEPER REJECTED: Failed Phase 3 (The Guardian). Reason: {guardian_report}")
+        logger.warning("REJECTED: Failed Phase 3 (The Guardian). Reason: %s", guardian_report)
         return None, "Rejected by Guardian"
 
-    print("Gatekeeper: All three security phases passed. Data is safe.")
+    logger.info("All three security phases passed. Data is safe.")
     return sanitized_data, "Approved by Gatekeeper"
 
 
@@ -38,10 +47,10 @@ def phase1_sentry_scan(data):
     """
     # In a real implementation, this would check against a database of virus signatures.
     # For now, we'll simulate a check. Let's assume no data is immediately obviously bad.
-    print("Sentry: Performing static analysis...")
+    logger.debug("Sentry: Performing static analysis...")
     if "malicious_signature" in str(data):
         return False, "Known malicious signature detected."
-    print("Sentry: Scan passed.")
+    logger.debug("Sentry: Scan passed.")
     return True, "No known malicious signatures found."
 
 
@@ -53,10 +62,10 @@ def phase2_interrogator_scan(data):
     """
     # This is a complex step to simulate. We'll pretend to run it in a sandbox.
     # We'll check for suspicious "intent", like trying to execute code.
-    print("Interrogator: Performing behavioral analysis in sandbox...")
+    logger.debug("Interrogator: Performing behavioral analysis in sandbox...")
     if "attempt_to_execute" in str(data):
         return False, "Data attempted to execute unauthorized code in sandbox."
-    print("Interrogator: Scan passed.")
+    logger.debug("Interrogator: Scan passed.")
     return True, "No suspicious behavior detected."
 
 
@@ -67,12 +76,12 @@ def phase3_guardian_scan(data):
     Placeholder function for now.
     """
     # We'll check for basic integrity and "sanitize" the data (e.g., remove scripts).
-    print("Guardian: Performing integrity check and sanitization...")
+    logger.debug("Guardian: Performing integrity check and sanitization...")
     if data is None:
         return False, None, "Data is null or corrupted."
 
     # Simulate sanitization: for now, we just return the data as is.
     sanitized_data = str(data).replace("<script>", "&lt;script&gt;")
 
-    print("Guardian: Scan passed.")
+    logger.debug("Guardian: Scan passed.")
     return True, sanitized_data, "Data integrity verified and content sanitized."